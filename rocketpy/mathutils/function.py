@@ -271,6 +271,14 @@ class Function:  # pylint: disable=too-many-public-methods
                 self.y_initial, self.y_final = self.y_array[0], self.y_array[-1]
                 self.z_array = source[:, 2]
                 self.z_initial, self.z_final = self.z_array[0], self.z_array[-1]
+                # N-D interpolators scan the whole domain on every evaluation,
+                # so keep it contiguous instead of a strided view of source
+                self._domain = np.ascontiguousarray(self._domain)
+                self._image = np.ascontiguousarray(self._image)
+                # domain bounds are fixed by the source, no need to recompute
+                # them on every evaluation
+                self._domain_min = self._domain.min(axis=0)
+                self._domain_max = self._domain.max(axis=0)
                 self.get_value_opt = self.__get_value_opt_nd
 
         self.source = source
@@ -325,9 +333,12 @@ class Function:  # pylint: disable=too-many-public-methods
 
     def __update_interpolation_coefficients(self, method):
         """Update interpolation coefficients for the given method."""
-        # Spline, akima and polynomial need data processing
-        # Shepard, and linear do not
-        if method == "polynomial":
+        # Spline, akima, polynomial and 1-D linear need data processing
+        # Shepard, rbf and N-D linear do not
+        if method == "linear" and self.__dom_dim__ == 1:
+            self.__interpolate_linear__()
+            self._coeffs = self.__linear_coefficients__
+        elif method == "polynomial":
             self.__interpolate_polynomial__()
             self._coeffs = self.__polynomial_coefficients__
         elif method == "akima":
@@ -369,17 +380,16 @@ class Function:  # pylint: disable=too-many-public-methods
         """Defines interpolation function used by the Function. Each
         interpolation method has its own function`.
         The function is stored in the attribute _interpolation_func."""
+        self._last_x = self._last_y = None
         interpolation = INTERPOLATION_TYPES[self.__interpolation__]
         if interpolation == 0:  # linear
             if self.__dom_dim__ == 1:
 
                 def linear_interpolation(x, x_min, x_max, x_data, y_data, coeffs):  # pylint: disable=unused-argument
-                    x_interval = bisect_left(x_data, x)
-                    x_left = x_data[x_interval - 1]
-                    y_left = y_data[x_interval - 1]
-                    dx = float(x_data[x_interval] - x_left)
-                    dy = float(y_data[x_interval] - y_left)
-                    return (x - x_left) * (dy / dx) + y_left
+                    x_interval = bisect_left(x_data, x) - 1
+                    x_left = x_data[x_interval]
+                    y_left = y_data[x_interval]
+                    return (x - x_left) * coeffs[x_interval] + y_left
 
             else:
                 interpolator = LinearNDInterpolator(self._domain, self._image)
@@ -456,6 +466,7 @@ class Function:  # pylint: disable=too-many-public-methods
         """Defines extrapolation function used by the Function. Each
         extrapolation method has its own function. The function is stored in
         the attribute _extrapolation_func."""
+        self._last_x = self._last_y = None
         interpolation = INTERPOLATION_TYPES[self.__interpolation__]
         extrapolation = EXTRAPOLATION_TYPES[self.__extrapolation__]
 
@@ -587,6 +598,10 @@ class Function:  # pylint: disable=too-many-public-methods
         y : scalar
             Value of the Function at the specified point.
         """
+        # Solvers often evaluate the same point several times in a row (e.g.
+        # every Jacobian column shares the same time), so reuse the last value
+        if x == self._last_x:
+            return self._last_y
         # Retrieve general info
         x_data = self.x_array
         y_data = self.y_array
@@ -596,6 +611,7 @@ class Function:  # pylint: disable=too-many-public-methods
             y = self._interpolation_func(x, x_min, x_max, x_data, y_data, coeffs)
         else:
             y = self._extrapolation_func(x, x_min, x_max, x_data, y_data, coeffs)
+        self._last_x, self._last_y = x, y
         return y
 
     def __get_value_opt_nd(self, *args):
@@ -615,8 +631,21 @@ class Function:  # pylint: disable=too-many-public-methods
         arg_qty = len(args)
         result = np.empty(arg_qty)
 
-        min_domain = self._domain.T.min(axis=1)
-        max_domain = self._domain.T.max(axis=1)
+        min_domain = self._domain_min
+        max_domain = self._domain_max
+
+        if arg_qty == 1:
+            # Single point, as evaluated in each simulation step: pick the
+            # method directly instead of building masks and fancy indexing
+            point = args[0]
+            if (point < min_domain).any() or (point > max_domain).any():
+                method = self._extrapolation_func
+            else:
+                method = self._interpolation_func
+            result[:] = method(
+                args, min_domain, max_domain, self._domain, self._image, None
+            )
+            return float(result[0])
 
         lower, upper = args < min_domain, args > max_domain
         extrap = np.logical_or(lower.any(axis=1), upper.any(axis=1))
@@ -630,9 +659,6 @@ class Function:  # pylint: disable=too-many-public-methods
                 args[~extrap], min_domain, max_domain, self._domain, self._image, None
             )
 
-        if arg_qty == 1:
-            return float(result[0])
-
         return result
 
     def __determine_1d_domain_bounds(self, lower, upper):
@@ -738,7 +764,9 @@ class Function:  # pylint: disable=too-many-public-methods
         # Create nodes to evaluate function
         xs = np.linspace(lower[0], upper[0], sam[0])
         ys = np.linspace(lower[1], upper[1], sam[1])
-        xs, ys = np.array(np.meshgrid(xs, ys)).reshape(2, xs.size * ys.size)
+        # Flattened mesh nodes, same ordering as np.meshgrid(xs, ys) but
+        # without building and stacking the two full mesh arrays
+        xs, ys = np.tile(xs, ys.size), np.repeat(ys, xs.size)
 
         # Evaluate function at all mesh nodes and convert it to matrix
         zs = np.array(func.get_value(xs, ys))
@@ -2017,7 +2045,7 @@ class Function:  # pylint: disable=too-many-public-methods
         mesh_x, mesh_y = np.meshgrid(x, y)
 
         # Evaluate function at all mesh nodes and convert it to matrix
-        z = np.array(self.get_value(mesh_x.flatten(), mesh_y.flatten())).reshape(
+        z = np.array(self.get_value(mesh_x.ravel(), mesh_y.ravel())).reshape(
             mesh_x.shape
         )
         z_min, z_max = z.min(), z.max()
@@ -2200,6 +2228,21 @@ class Function:  # pylint: disable=too-many-public-methods
             return fig, ax
 
     # Define all interpolation methods
+    def __interpolate_linear__(self):
+        """Calculate the slope of each interval of the linear interpolation."""
+        # Get x and y values for all supplied points
+        x, y = self.x_array, self.y_array
+        # Slope k goes from point k to k + 1. The last one wraps around to the
+        # first point, which is the interval used when evaluating at x_initial
+        dx = np.roll(x, -1) - x
+        dy = np.roll(y, -1) - y
+        # Repeated x values, or a single point source, give zero width
+        # intervals. Treat them as constant segments instead of dividing by 0
+        degenerate = dx == 0
+        dx[degenerate] = 1
+        dy[degenerate] = 0
+        self.__linear_coefficients__ = dy / dx
+
     def __interpolate_polynomial__(self):
         """Calculate polynomial coefficients that fit the data exactly."""
         # Find the degree of the polynomial interpolation
@@ -214,9 +214,12 @@ class ClusterMotor:
             self.motors, self.positions, self.orientations
         ):
             force_magnitude = motor.thrust.get_value_opt(t)
-            force = force_magnitude * orientation
-            arm = pos - ref_point_arr
-            total_moment += np.cross(arm, force)
+            force_x, force_y, force_z = force_magnitude * orientation
+            arm_x, arm_y, arm_z = pos - ref_point_arr
+            # Explicit cross product, np.cross overhead dominates for 3-vectors
+            total_moment[0] += arm_y * force_z - arm_z * force_y
+            total_moment[1] += arm_z * force_x - arm_x * force_z
+            total_moment[2] += arm_x * force_y - arm_y * force_x
 
             if hasattr(motor, "thrust_eccentricity_y") and hasattr(
                 motor, "thrust_eccentricity_x"
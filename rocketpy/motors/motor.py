@@ -1127,10 +1127,10 @@ class Motor(ABC):
         # Open and read .eng file
         with open(file_name) as file:
             for line in file:
-                if re.search(r";.*", line):
+                line, separator, comment = line.partition(";")
+                if separator:
                     # Extract comment
-                    comments.append(re.findall(r";.*", line)[0])
-                    line = re.sub(r";.*", "", line)
+                    comments.append(separator + comment.removesuffix("\n"))
                 if line.strip():
                     if not description:
                         # Extract description
@@ -13,6 +13,7 @@ from ..mathutils.function import Function, funcify_method
 from ..mathutils.vector_matrix import Matrix, Vector
 from ..plots.flight_plots import _FlightPlots
 from ..prints.flight_prints import _FlightPrints
+from ..rocket.aero_surface.generic_surface import GenericSurface
 from ..tools import (
     calculate_cubic_hermite_coefficients,
     deprecated,
@@ -34,6 +35,9 @@ ODE_SOLVER_MAP = {
     "LSODA": LSODA,
 }
 
+# Volume of a half ellipsoid is (2 / 3) * pi * radius**2 * height
+HALF_ELLIPSOID_VOLUME_FACTOR = 2 * math.pi / 3
+
 
 # pylint: disable=too-many-public-methods
 # pylint: disable=too-many-instance-attributes
@@ -1514,9 +1518,7 @@ class Flight:
         # Mass
         rocket_dry_mass = self.rocket.dry_mass  # already with motor's dry mass
         total_mass_at_t = propellant_mass_at_t + rocket_dry_mass
-        mu = (propellant_mass_at_t * rocket_dry_mass) / (
-            propellant_mass_at_t + rocket_dry_mass
-        )
+        mu = (propellant_mass_at_t * rocket_dry_mass) / total_mass_at_t
         # Geometry
         # b = -self.rocket.distance_rocket_propellant
         b = (
@@ -1559,18 +1561,16 @@ class Flight:
         else:
             drag_coeff = self.rocket.power_off_drag.get_value_opt(free_stream_mach)
         rho = self.env.density.get_value_opt(z)
-        R3 = -0.5 * rho * (free_stream_speed**2) * self.rocket.area * drag_coeff
+        # Shared by the rocket and air brakes drag forces
+        dynamic_pressure = 0.5 * rho * free_stream_speed**2
+        R3 = -dynamic_pressure * self.rocket.area * drag_coeff
         for air_brakes in self.rocket.air_brakes:
             if air_brakes.deployment_level > 0:
                 air_brakes_cd = air_brakes.drag_coefficient.get_value_opt(
                     air_brakes.deployment_level, free_stream_mach
                 )
                 air_brakes_force = (
-                    -0.5
-                    * rho
-                    * (free_stream_speed**2)
-                    * air_brakes.reference_area
-                    * air_brakes_cd
+                    -dynamic_pressure * air_brakes.reference_area * air_brakes_cd
                 )
                 if air_brakes.override_rocket_drag:
                     R3 = air_brakes_force  # Substitutes rocket drag coefficient
@@ -1600,15 +1600,17 @@ class Flight:
             comp_stream_velocity = comp_wind_vb - comp_vb
             comp_stream_speed = abs(comp_stream_velocity)
             comp_stream_mach = comp_stream_speed / speed_of_sound
-            # Reynolds at component altitude
-            # TODO: Reynolds is only used in generic surfaces. This calculation
-            # should be moved to the surface class for efficiency
-            comp_reynolds = (
-                self.env.density.get_value_opt(comp_z)
-                * comp_stream_speed
-                * aero_surface.reference_length
-                / self.env.dynamic_viscosity.get_value_opt(comp_z)
-            )
+            # Reynolds at component altitude, only used by generic surfaces,
+            # so the extra density and viscosity lookups are skipped otherwise
+            if isinstance(aero_surface, GenericSurface):
+                comp_reynolds = (
+                    self.env.density.get_value_opt(comp_z)
+                    * comp_stream_speed
+                    * aero_surface.reference_length
+                    / self.env.dynamic_viscosity.get_value_opt(comp_z)
+                )
+            else:
+                comp_reynolds = None
             # Forces and moments
             X, Y, Z, M, N, L = aero_surface.compute_forces_and_moments(
                 comp_stream_velocity,
@@ -1630,56 +1632,29 @@ class Flight:
 
         # Calculate derivatives
         # Angular acceleration
+        # Terms shared by both transverse components are evaluated once
+        rocket_I_11 = rocket_dry_I_11 + motor_I_11_at_t + mu * b**2
+        rocket_I_33 = rocket_dry_I_33 + motor_I_33_at_t
+        transverse_damping = (
+            motor_I_11_derivative_at_t
+            + mass_flow_rate_at_t * (rocket_dry_mass - 1) * (b / total_mass_at_t) ** 2
+        ) - mass_flow_rate_at_t * (
+            (nozzle_radius / 2) ** 2 + (c - b * mu / rocket_dry_mass) ** 2
+        )
         alpha1 = (
             M1
             - (
-                omega2
-                * omega3
-                * (
-                    rocket_dry_I_33
-                    + motor_I_33_at_t
-                    - rocket_dry_I_11
-                    - motor_I_11_at_t
-                    - mu * b**2
-                )
-                + omega1
-                * (
-                    (
-                        motor_I_11_derivative_at_t
-                        + mass_flow_rate_at_t
-                        * (rocket_dry_mass - 1)
-                        * (b / total_mass_at_t) ** 2
-                    )
-                    - mass_flow_rate_at_t
-                    * ((nozzle_radius / 2) ** 2 + (c - b * mu / rocket_dry_mass) ** 2)
-                )
+                omega2 * omega3 * (rocket_I_33 - rocket_I_11)
+                + omega1 * transverse_damping
             )
-        ) / (rocket_dry_I_11 + motor_I_11_at_t + mu * b**2)
+        ) / rocket_I_11
         alpha2 = (
             M2
             - (
-                omega1
-                * omega3
-                * (
-                    rocket_dry_I_11
-                    + motor_I_11_at_t
-                    + mu * b**2
-                    - rocket_dry_I_33
-                    - motor_I_33_at_t
-                )
-                + omega2
-                * (
-                    (
-                        motor_I_11_derivative_at_t
-                        + mass_flow_rate_at_t
-                        * (rocket_dry_mass - 1)
-                        * (b / total_mass_at_t) ** 2
-                    )
-                    - mass_flow_rate_at_t
-                    * ((nozzle_radius / 2) ** 2 + (c - b * mu / rocket_dry_mass) ** 2)
-                )
+                omega1 * omega3 * (rocket_I_11 - rocket_I_33)
+                + omega2 * transverse_damping
             )
-        ) / (rocket_dry_I_11 + motor_I_11_at_t + mu * b**2)
+        ) / rocket_I_11
         alpha3 = (
             M3
             - omega3
@@ -1687,7 +1662,7 @@ class Flight:
                 motor_I_33_derivative_at_t
                 - mass_flow_rate_at_t * (nozzle_radius**2) / 2
             )
-        ) / (rocket_dry_I_33 + motor_I_33_at_t)
+        ) / rocket_I_33
         # Euler parameters derivative
         e0dot = 0.5 * (-omega1 * e1 - omega2 * e2 - omega3 * e3)
         e1dot = 0.5 * (omega1 * e0 + omega3 * e2 - omega2 * e3)
@@ -1842,18 +1817,16 @@ class Flight:
         else:
             net_thrust = 0
             drag_coeff = self.rocket.power_off_drag.get_value_opt(free_stream_mach)
-        R3 += -0.5 * rho * (free_stream_speed**2) * self.rocket.area * drag_coeff
+        # Shared by the rocket and air brakes drag forces
+        dynamic_pressure = 0.5 * rho * free_stream_speed**2
+        R3 += -dynamic_pressure * self.rocket.area * drag_coeff
         for air_brakes in self.rocket.air_brakes:
             if air_brakes.deployment_level > 0:
                 air_brakes_cd = air_brakes.drag_coefficient.get_value_opt(
                     air_brakes.deployment_level, free_stream_mach
                 )
                 air_brakes_force = (
-                    -0.5
-                    * rho
-                    * (free_stream_speed**2)
-                    * air_brakes.reference_area
-                    * air_brakes_cd
+                    -dynamic_pressure * air_brakes.reference_area * air_brakes_cd
                 )
                 if air_brakes.override_rocket_drag:
                     R3 = air_brakes_force  # Substitutes rocket drag coefficient
@@ -1876,15 +1849,17 @@ class Flight:
             comp_stream_velocity = comp_wind_vb - comp_vb
             comp_stream_speed = abs(comp_stream_velocity)
             comp_stream_mach = comp_stream_speed / speed_of_sound
-            # Reynolds at component altitude
-            # TODO: Reynolds is only used in generic surfaces. This calculation
-            # should be moved to the surface class for efficiency
-            comp_reynolds = (
-                self.env.density.get_value_opt(comp_z)
-                * comp_stream_speed
-                * aero_surface.reference_length
-                / self.env.dynamic_viscosity.get_value_opt(comp_z)
-            )
+            # Reynolds at component altitude, only used by generic surfaces,
+            # so the extra density and viscosity lookups are skipped otherwise
+            if isinstance(aero_surface, GenericSurface):
+                comp_reynolds = (
+                    self.env.density.get_value_opt(comp_z)
+                    * comp_stream_speed
+                    * aero_surface.reference_length
+                    / self.env.dynamic_viscosity.get_value_opt(comp_z)
+                )
+            else:
+                comp_reynolds = None
             # Forces and moments
             X, Y, Z, M, N, L = aero_surface.compute_forces_and_moments(
                 comp_stream_velocity,
@@ -2017,11 +1992,11 @@ class Flight:
         ma = (
             self.parachute_added_mass_coefficient
             * rho
-            * (2 / 3)
-            * np.pi
+            * HALF_ELLIPSOID_VOLUME_FACTOR
             * self.parachute_radius**2
             * self.parachute_height
         )
+        total_mass = mp + ma
 
         # Calculate freestream speed
         freestream_x = vx - wind_velocity_x
@@ -2035,9 +2010,9 @@ class Flight:
         Dx = pseudo_drag * freestream_x  # add eta efficiency for wake
         Dy = pseudo_drag * freestream_y
         Dz = pseudo_drag * freestream_z
-        ax = Dx / (mp + ma)
-        ay = Dy / (mp + ma)
-        az = (Dz - mp * self.env.gravity.get_value_opt(z)) / (mp + ma)
+        ax = Dx / total_mass
+        ay = Dy / total_mass
+        az = (Dz - mp * self.env.gravity.get_value_opt(z)) / total_mass
 
         # Add coriolis acceleration
         _, w_earth_y, w_earth_z = self.env.earth_rotation_vector
@@ -2866,7 +2841,7 @@ class Flight:
             out=np.zeros_like(stream_vz_body),
             where=free_stream_speed > 1e-6,
         )
-        stream_vz_body_normalized = np.clip(stream_vz_body_normalized, -1, 1)
+        np.clip(stream_vz_body_normalized, -1, 1, out=stream_vz_body_normalized)
 
         # Calculate angle of attack and convert to degrees
         angle_of_attack = np.rad2deg(np.arccos(stream_vz_body_normalized))
@@ -3219,11 +3194,17 @@ class Flight:
             current_derivative = phase.derivative
             for callback in phase.callbacks:
                 callback(self)
-            for step in self.solution:
-                if init_time < step[0] <= final_time or (
-                    init_time == self.t_initial and step[0] == self.t_initial
-                ):
-                    current_derivative(step[0], step[1:], post_processing=True)
+            # Steps in (init_time, final_time], also including the initial
+            # step for the first phase. The time column is sorted, so the
+            # range is found by bisection instead of scanning every step.
+            first_step = np.searchsorted(
+                self.time,
+                init_time,
+                side="left" if init_time == self.t_initial else "right",
+            )
+            last_step = np.searchsorted(self.time, final_time, side="right")
+            for step in self.solution[first_step:last_step]:
+                current_derivative(step[0], step[1:], post_processing=True)
 
         return np.array(self.__post_processed_variables)
 
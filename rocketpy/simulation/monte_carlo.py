@@ -185,8 +185,9 @@ class MonteCarlo:
         n_workers : int, optional
             Number of workers to be used if ``parallel=True``. If None, the
             number of workers will be equal to the number of CPUs available.
-            A minimum of 2 workers is required for parallel mode.
-            Default is None.
+            A minimum of 2 workers is required for parallel mode. No more
+            workers than remaining simulations are started, so a single
+            remaining simulation is run in serial mode. Default is None.
         kwargs : dict
             Custom arguments for simulation export of the ``inputs`` file. Options
             are:
@@ -322,6 +323,13 @@ class MonteCarlo:
         None
         """
         n_workers = self.__validate_number_of_workers(n_workers)
+        # Each worker pickles the whole MonteCarlo object on start-up, so
+        # do not spawn more workers than there are simulations left to run
+        remaining_sims = self.number_of_simulations - self._initial_sim_idx
+        n_workers = min(n_workers, remaining_sims)
+        if n_workers < 2:
+            self.__run_in_serial()
+            return
 
         _SimMonitor.reprint(f"Running Monte Carlo simulation with {n_workers} workers.")
 
@@ -755,10 +763,8 @@ class MonteCarlo:
         -------
         None
         """
-        self.inputs_log = []
         with open(self.input_file, mode="r", encoding="utf-8") as rows:
-            for line in rows:
-                self.inputs_log.append(json.loads(line))
+            self.inputs_log = [json.loads(line) for line in rows]
 
     def set_outputs_log(self):
         """
@@ -768,10 +774,8 @@ class MonteCarlo:
         -------
         None
         """
-        self.outputs_log = []
         with open(self.output_file, mode="r", encoding="utf-8") as rows:
-            for line in rows:
-                self.outputs_log.append(json.loads(line))
+            self.outputs_log = [json.loads(line) for line in rows]
 
     def set_errors_log(self):
         """
@@ -781,22 +785,20 @@ class MonteCarlo:
         -------
         None
         """
-        self.errors_log = []
         with open(self.error_file, mode="r", encoding="utf-8") as errors:
-            for line in errors:
-                self.errors_log.append(json.loads(line))
+            self.errors_log = [json.loads(line) for line in errors]
 
     def set_num_of_loaded_sims(self):
         """
         Determines the number of simulations loaded from output_file being
-        currently used.
+        currently used. Each entry of outputs_log is one simulation, so the
+        output file is not read again.
 
         Returns
         -------
         None
         """
-        with open(self.output_file, mode="r", encoding="utf-8") as outputs:
-            self.num_of_loaded_sims = sum(1 for _ in outputs)
+        self.num_of_loaded_sims = len(self.outputs_log)
 
     def set_results(self):
         """
@@ -835,11 +837,11 @@ class MonteCarlo:
         self.processed_results = {}
         for result, values in self.results.items():
             try:
+                # convert once instead of on every numpy reduction
+                values = np.asarray(values)
                 mean = np.mean(values)
                 stdev = np.std(values)
-                self.processed_results[result] = (mean, stdev)
-                pi_low = np.quantile(values, 0.025)
-                pi_high = np.quantile(values, 0.975)
+                pi_low, pi_high = np.quantile(values, [0.025, 0.975])
                 median = np.median(values)
             except TypeError:
                 mean = None
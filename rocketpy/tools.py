@@ -1408,6 +1408,68 @@ def from_hex_decode(obj_bytes, decoder=base64.b85decode):
     return dill.loads(decoder(bytes.fromhex(obj_bytes)))
 
 
+def find_obj_from_hash(obj, hash_, depth_limit=None):
+    """Searches an object and everything it contains for the object whose
+    ``__rpy_hash`` attribute matches a given hash. The decoder stores this
+    attribute on every object that was encoded together with its hash.
+
+    Parameters
+    ----------
+    obj : object
+        Object to be searched. Dictionaries, lists, tuples, sets and the
+        ``__dict__`` of objects are searched recursively.
+    hash_ : int
+        Hash value to be found.
+    depth_limit : int, optional
+        Maximum depth of the search. If None, the search has no depth limit.
+        Default is None.
+
+    Returns
+    -------
+    object
+        The first object found whose ``__rpy_hash`` equals ``hash_``, or None
+        if there is no such object.
+
+    Examples
+    --------
+    >>> from types import SimpleNamespace
+    >>> from rocketpy.tools import find_obj_from_hash
+    >>> target = SimpleNamespace()
+    >>> setattr(target, "__rpy_hash", 42)
+    >>> data = {"a": [1, 2], "b": SimpleNamespace(child=target)}
+    >>> data["b"].parent = data
+    >>> find_obj_from_hash(data, 42) is target
+    True
+    >>> find_obj_from_hash(data, 42, depth_limit=1) is None
+    True
+    """
+    # Depth-first search with an explicit stack. Decoded objects reference
+    # each other in cycles, so every container is only visited once.
+    visited = set()
+    stack = [(obj, 0)]
+    while stack:
+        current, depth = stack.pop()
+        if id(current) in visited:
+            continue
+        visited.add(id(current))
+
+        if getattr(current, "__rpy_hash", None) == hash_:
+            return current
+        if depth_limit is not None and depth >= depth_limit:
+            continue
+
+        if isinstance(current, dict):
+            children = current.values()
+        elif isinstance(current, (list, tuple, set)):
+            children = current
+        elif hasattr(current, "__dict__"):
+            children = vars(current).values()
+        else:
+            continue
+        stack.extend((child, depth + 1) for child in reversed(list(children)))
+    return None
+
+
 if __name__ == "__main__":  # pragma: no cover
     import doctest
 
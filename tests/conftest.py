@@ -1,3 +1,4 @@
+import matplotlib.pyplot as plt
 import pytest
 
 # Pytest configuration
@@ -27,6 +28,17 @@ pytest_plugins = [
 ]
 
 
+@pytest.fixture(autouse=True)
+def close_matplotlib_figures():
+    """Close every matplotlib figure after each test. Most plotting tests mock
+    ``matplotlib.pyplot.show``, so the figures created by ``all_info`` and the
+    like would otherwise stay alive, together with their canvas buffers, until
+    the end of the test session.
+    """
+    yield
+    plt.close("all")
+
+
 def pytest_addoption(parser):
     """Add option to run slow tests. This is used to skip slow tests by default.
 
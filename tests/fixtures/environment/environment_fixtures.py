@@ -3,20 +3,40 @@ from datetime import datetime, timedelta
 import pytest
 
 from rocketpy import Environment, EnvironmentAnalysis
+from tests.fixtures.session_copy import session_copy_factory
+
+
+@pytest.fixture(scope="session")
+def example_plain_env_factory():
+    """Session-scoped factory of the example_plain_env fixture.
+
+    Returns
+    -------
+    callable
+        A function with no arguments that returns a new copy of the
+        rocketpy.Environment described in the example_plain_env fixture.
+    """
+    return session_copy_factory(Environment)
 
 
 @pytest.fixture
-def example_plain_env():
+def example_plain_env(example_plain_env_factory):
     """Simple object of the Environment class to be used in the tests.
 
+    Parameters
+    ----------
+    example_plain_env_factory : callable
+        Session-scoped factory of the environment. This is a pytest fixture
+        too.
+
     Returns
     -------
     rocketpy.Environment
     """
-    return Environment()
+    return example_plain_env_factory()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def example_date_naive():
     """Naive tomorrow date
 
@@ -27,22 +47,50 @@ def example_date_naive():
     return datetime.now() + timedelta(days=1)
 
 
+@pytest.fixture(scope="session")
+def example_spaceport_env_factory(example_date_naive):
+    """Session-scoped factory of the example_spaceport_env fixture.
+
+    Parameters
+    ----------
+    example_date_naive : datetime.datetime
+        The launch date. This is a pytest fixture too.
+
+    Returns
+    -------
+    callable
+        A function with no arguments that returns a new copy of the
+        rocketpy.Environment described in the example_spaceport_env fixture.
+    """
+
+    def build():
+        spaceport_env = Environment(
+            latitude=32.990254,
+            longitude=-106.974998,
+            elevation=1400,
+            datum="WGS84",
+        )
+        spaceport_env.set_date(example_date_naive)
+        return spaceport_env
+
+    return session_copy_factory(build)
+
+
 @pytest.fixture
-def example_spaceport_env(example_date_naive):
+def example_spaceport_env(example_spaceport_env_factory):
     """Environment class with location set to Spaceport America Cup launch site
 
+    Parameters
+    ----------
+    example_spaceport_env_factory : callable
+        Session-scoped factory of the environment. This is a pytest fixture
+        too.
+
     Returns
     -------
     rocketpy.Environment
     """
-    spaceport_env = Environment(
-        latitude=32.990254,
-        longitude=-106.974998,
-        elevation=1400,
-        datum="WGS84",
-    )
-    spaceport_env.set_date(example_date_naive)
-    return spaceport_env
+    return example_spaceport_env_factory()
 
 
 @pytest.fixture
@@ -63,9 +111,11 @@ def example_euroc_env(example_date_naive):
     return euroc_env
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def env_analysis():
-    """Environment Analysis class with hardcoded parameters
+    """Environment Analysis class with hardcoded parameters. Parsing the two
+    NetCDF reanalysis files is expensive, so the object is built only once per
+    test session. Tests must not modify it; use ``copy.deepcopy`` instead.
 
     Returns
     -------
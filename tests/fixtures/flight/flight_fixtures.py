@@ -1,20 +1,50 @@
+import copy
+
 import pytest
 
 from rocketpy import Flight
+from tests.fixtures.session_copy import session_copy_factory
+
+
+@pytest.fixture(scope="session")
+def flight_calisto_factory():
+    """Session-scoped factory of rocketpy.Flight objects. Running the flight
+    simulation is by far the most expensive part of the test setup, therefore
+    each flight fixture is simulated only once per test session. Every call
+    returns a deep copy of the stored simulation, so tests are free to modify
+    the returned Flight without affecting other tests.
+
+    Returns
+    -------
+    callable
+        A function ``factory(name, builder)`` that returns a copy of the
+        Flight stored under ``name``. The zero-argument ``builder`` is only
+        called the first time ``name`` is requested, to create the Flight.
+    """
+    flight_factories = {}
+
+    def factory(name, builder):
+        if name not in flight_factories:
+            flight_factories[name] = session_copy_factory(builder)
+        return flight_factories[name]()
+
+    return factory
 
 
 @pytest.fixture
-def flight_calisto(calisto, example_plain_env):  # old name: flight
+def flight_calisto(request, flight_calisto_factory):  # old name: flight
     """A rocketpy.Flight object of the Calisto rocket. This uses the calisto
     without the aerodynamic surfaces and parachutes. The environment is the
     simplest possible, with no parameters set.
 
     Parameters
     ----------
-    calisto : rocketpy.Rocket
-        An object of the Rocket class. This is a pytest fixture too.
-    example_plain_env : rocketpy.Environment
-        An object of the Environment class. This is a pytest fixture too.
+    request : pytest.FixtureRequest
+        Used to request the calisto and example_plain_env fixtures,
+        only when the Flight is simulated for the first time.
+    flight_calisto_factory : callable
+        Session-scoped factory of Flight objects. This is a pytest fixture
+        too.
 
     Returns
     -------
@@ -22,28 +52,34 @@ def flight_calisto(calisto, example_plain_env):  # old name: flight
         A rocketpy.Flight object of the Calisto rocket in the simplest possible
         conditions.
     """
-    return Flight(
-        environment=example_plain_env,
-        rocket=calisto,
-        rail_length=5.2,
-        inclination=85,
-        heading=0,
-        terminate_on_apogee=False,
-    )
+
+    def build():
+        return Flight(
+            environment=request.getfixturevalue("example_plain_env"),
+            rocket=request.getfixturevalue("calisto"),
+            rail_length=5.2,
+            inclination=85,
+            heading=0,
+            terminate_on_apogee=False,
+        )
+
+    return flight_calisto_factory("flight_calisto", build)
 
 
 @pytest.fixture
-def flight_calisto_nose_to_tail(calisto_nose_to_tail, example_plain_env):
+def flight_calisto_nose_to_tail(request, flight_calisto_factory):
     """A rocketpy.Flight object of the Calisto rocket. This uses the calisto
     with "nose_to_tail" coordinate system orientation, just as described in the
     calisto_nose_to_tail fixture.
 
     Parameters
     ----------
-    calisto_nose_to_tail : rocketpy.Rocket
-        An object of the Rocket class. This is a pytest fixture too.
-    example_plain_env : rocketpy.Environment
-        An object of the Environment class. This is a pytest fixture too.
+    request : pytest.FixtureRequest
+        Used to request the calisto_nose_to_tail and example_plain_env fixtures,
+        only when the Flight is simulated for the first time.
+    flight_calisto_factory : callable
+        Session-scoped factory of Flight objects. This is a pytest fixture
+        too.
 
     Returns
     -------
@@ -51,18 +87,22 @@ def flight_calisto_nose_to_tail(calisto_nose_to_tail, example_plain_env):
         The Calisto rocket with the coordinate system orientation set to
         "nose_to_tail".
     """
-    return Flight(
-        environment=example_plain_env,
-        rocket=calisto_nose_to_tail,
-        rail_length=5.2,
-        inclination=85,
-        heading=0,
-        terminate_on_apogee=False,
-    )
+
+    def build():
+        return Flight(
+            environment=request.getfixturevalue("example_plain_env"),
+            rocket=request.getfixturevalue("calisto_nose_to_tail"),
+            rail_length=5.2,
+            inclination=85,
+            heading=0,
+            terminate_on_apogee=False,
+        )
+
+    return flight_calisto_factory("flight_calisto_nose_to_tail", build)
 
 
 @pytest.fixture
-def flight_calisto_robust(calisto_robust, example_spaceport_env):
+def flight_calisto_robust(request, flight_calisto_factory):
     """A rocketpy.Flight object of the Calisto rocket. This uses the calisto
     with the aerodynamic surfaces and parachutes. The environment is a bit more
     complex than the one in the flight_calisto fixture. This time the latitude,
@@ -72,10 +112,12 @@ def flight_calisto_robust(calisto_robust, example_spaceport_env):
 
     Parameters
     ----------
-    calisto_robust : rocketpy.Rocket
-        An object of the Rocket class. This is a pytest fixture too.
-    example_spaceport_env : rocketpy.Environment
-        An object of the Environment class. This is a pytest fixture too.
+    request : pytest.FixtureRequest
+        Used to request the calisto_robust and example_spaceport_env fixtures,
+        only when the Flight is simulated for the first time.
+    flight_calisto_factory : callable
+        Session-scoped factory of Flight objects. This is a pytest fixture
+        too.
 
     Returns
     -------
@@ -83,103 +125,125 @@ def flight_calisto_robust(calisto_robust, example_spaceport_env):
         A rocketpy.Flight object of the Calisto rocket in a more complex
         condition.
     """
-    return Flight(
-        environment=example_spaceport_env,
-        rocket=calisto_robust,
-        rail_length=5.2,
-        inclination=85,
-        heading=0,
-        terminate_on_apogee=False,
-    )
+
+    def build():
+        return Flight(
+            environment=request.getfixturevalue("example_spaceport_env"),
+            rocket=request.getfixturevalue("calisto_robust"),
+            rail_length=5.2,
+            inclination=85,
+            heading=0,
+            terminate_on_apogee=False,
+        )
+
+    return flight_calisto_factory("flight_calisto_robust", build)
 
 
 @pytest.fixture
-def flight_calisto_nose_to_tail_robust(
-    calisto_nose_to_tail_robust, example_spaceport_env
-):
-    return Flight(
-        environment=example_spaceport_env,
-        rocket=calisto_nose_to_tail_robust,
-        rail_length=5.2,
-        inclination=85,
-        heading=0,
-        terminate_on_apogee=False,
-    )
+def flight_calisto_nose_to_tail_robust(request, flight_calisto_factory):
+
+    def build():
+        return Flight(
+            environment=request.getfixturevalue("example_spaceport_env"),
+            rocket=request.getfixturevalue("calisto_nose_to_tail_robust"),
+            rail_length=5.2,
+            inclination=85,
+            heading=0,
+            terminate_on_apogee=False,
+        )
+
+    return flight_calisto_factory("flight_calisto_nose_to_tail_robust", build)
 
 
 @pytest.fixture
-def flight_calisto_robust_solid_eom(calisto_robust, example_spaceport_env):
+def flight_calisto_robust_solid_eom(request, flight_calisto_factory):
     """Similar to flight_calisto_robust, but with the equations of motion set to
     "solid_propulsion".
     """
-    return Flight(
-        environment=example_spaceport_env,
-        rocket=calisto_robust,
-        rail_length=5.2,
-        inclination=85,
-        heading=0,
-        terminate_on_apogee=False,
-        equations_of_motion="solid_propulsion",
-    )
+
+    def build():
+        return Flight(
+            environment=request.getfixturevalue("example_spaceport_env"),
+            rocket=request.getfixturevalue("calisto_robust"),
+            rail_length=5.2,
+            inclination=85,
+            heading=0,
+            terminate_on_apogee=False,
+            equations_of_motion="solid_propulsion",
+        )
+
+    return flight_calisto_factory("flight_calisto_robust_solid_eom", build)
 
 
 @pytest.fixture
-def flight_calisto_liquid_modded(calisto_liquid_modded, example_plain_env):
+def flight_calisto_liquid_modded(request, flight_calisto_factory):
     """A rocketpy.Flight object of the Calisto rocket modded for a liquid
     motor. The environment is the simplest possible, with no parameters set.
 
     Parameters
     ----------
-    calisto_liquid_modded : rocketpy.Rocket
-        An object of the Rocket class. This is a pytest fixture too.
-    example_plain_env : rocketpy.Environment
-        An object of the Environment class. This is a pytest fixture too.
+    request : pytest.FixtureRequest
+        Used to request the calisto_liquid_modded and example_plain_env fixtures,
+        only when the Flight is simulated for the first time.
+    flight_calisto_factory : callable
+        Session-scoped factory of Flight objects. This is a pytest fixture
+        too.
 
     Returns
     -------
     rocketpy.Flight
         A rocketpy.Flight object.
     """
-    return Flight(
-        rocket=calisto_liquid_modded,
-        environment=example_plain_env,
-        rail_length=5,
-        inclination=85,
-        heading=0,
-        max_time_step=0.25,
-    )
+
+    def build():
+        return Flight(
+            rocket=request.getfixturevalue("calisto_liquid_modded"),
+            environment=request.getfixturevalue("example_plain_env"),
+            rail_length=5,
+            inclination=85,
+            heading=0,
+            max_time_step=0.25,
+        )
+
+    return flight_calisto_factory("flight_calisto_liquid_modded", build)
 
 
 @pytest.fixture
-def flight_calisto_hybrid_modded(calisto_hybrid_modded, example_plain_env):
+def flight_calisto_hybrid_modded(request, flight_calisto_factory):
     """A rocketpy.Flight object of the Calisto rocket modded for a hybrid
     motor. The environment is the simplest possible, with no parameters set.
 
     Parameters
     ----------
-    calisto_hybrid_modded : rocketpy.Rocket
-        An object of the Rocket class. This is a pytest fixture too.
-    example_plain_env : rocketpy.Environment
-        An object of the Environment class. This is a pytest fixture too.
+    request : pytest.FixtureRequest
+        Used to request the calisto_hybrid_modded and example_plain_env fixtures,
+        only when the Flight is simulated for the first time.
+    flight_calisto_factory : callable
+        Session-scoped factory of Flight objects. This is a pytest fixture
+        too.
 
     Returns
     -------
     rocketpy.Flight
         A rocketpy.Flight object.
     """
-    return Flight(
-        rocket=calisto_hybrid_modded,
-        environment=example_plain_env,
-        rail_length=5.2,
-        inclination=85,
-        heading=0,
-        time_overshoot=False,
-        terminate_on_apogee=True,
-    )
+
+    def build():
+        return Flight(
+            rocket=request.getfixturevalue("calisto_hybrid_modded"),
+            environment=request.getfixturevalue("example_plain_env"),
+            rail_length=5.2,
+            inclination=85,
+            heading=0,
+            time_overshoot=False,
+            terminate_on_apogee=True,
+        )
+
+    return flight_calisto_factory("flight_calisto_hybrid_modded", build)
 
 
 @pytest.fixture
-def flight_calisto_custom_wind(calisto_robust, example_spaceport_env):
+def flight_calisto_custom_wind(request, flight_calisto_factory):
     """A rocketpy.Flight object of the Calisto rocket. This uses the calisto
     with the aerodynamic surfaces and parachutes. The environment is a bit more
     complex than the one in the flight_calisto_robust fixture. Now the wind is
@@ -187,35 +251,42 @@ def flight_calisto_custom_wind(calisto_robust, example_spaceport_env):
 
     Parameters
     ----------
-    calisto_robust : rocketpy.Rocket
-        An object of the Rocket class. This is a pytest fixture too.
-    example_spaceport_env : rocketpy.Environment
-        An object of the Environment class. This is a pytest fixture too.
+    request : pytest.FixtureRequest
+        Used to request the calisto_robust and example_spaceport_env fixtures,
+        only when the Flight is simulated for the first time.
+    flight_calisto_factory : callable
+        Session-scoped factory of Flight objects. This is a pytest fixture
+        too.
 
     Returns
     -------
     rocketpy.Flight
 
     """
-    env = example_spaceport_env
-    env.set_atmospheric_model(
-        type="custom_atmosphere",
-        temperature=300,
-        wind_u=[(0, 5), (4000, 5)],
-        wind_v=[(0, 2), (4000, 2)],
-    )
-    return Flight(
-        environment=env,
-        rocket=calisto_robust,
-        rail_length=5.2,
-        inclination=85,
-        heading=0,
-        terminate_on_apogee=False,
-    )
+
+    def build():
+        # Work on a copy so the example_spaceport_env given to the test is intact
+        env = copy.deepcopy(request.getfixturevalue("example_spaceport_env"))
+        env.set_atmospheric_model(
+            type="custom_atmosphere",
+            temperature=300,
+            wind_u=[(0, 5), (4000, 5)],
+            wind_v=[(0, 2), (4000, 2)],
+        )
+        return Flight(
+            environment=env,
+            rocket=request.getfixturevalue("calisto_robust"),
+            rail_length=5.2,
+            inclination=85,
+            heading=0,
+            terminate_on_apogee=False,
+        )
+
+    return flight_calisto_factory("flight_calisto_custom_wind", build)
 
 
 @pytest.fixture
-def flight_calisto_air_brakes(calisto_air_brakes_clamp_on, example_plain_env):
+def flight_calisto_air_brakes(request, flight_calisto_factory):
     """A rocketpy.Flight object of the Calisto rocket. This uses the calisto
     with the aerodynamic surfaces and air brakes. The environment is the
     simplest possible, with no parameters set. The air brakes are set to clamp
@@ -223,10 +294,12 @@ def flight_calisto_air_brakes(calisto_air_brakes_clamp_on, example_plain_env):
 
     Parameters
     ----------
-    calisto_air_brakes_clamp_on : rocketpy.Rocket
-        An object of the Rocket class.
-    example_plain_env : rocketpy.Environment
-        An object of the Environment class.
+    request : pytest.FixtureRequest
+        Used to request the calisto_air_brakes_clamp_on and example_plain_env fixtures,
+        only when the Flight is simulated for the first time.
+    flight_calisto_factory : callable
+        Session-scoped factory of Flight objects. This is a pytest fixture
+        too.
 
     Returns
     -------
@@ -234,29 +307,35 @@ def flight_calisto_air_brakes(calisto_air_brakes_clamp_on, example_plain_env):
         A rocketpy.Flight object of the Calisto rocket in a more complex
         condition.
     """
-    return Flight(
-        rocket=calisto_air_brakes_clamp_on,
-        environment=example_plain_env,
-        rail_length=5.2,
-        inclination=85,
-        heading=0,
-        time_overshoot=False,
-        terminate_on_apogee=True,
-    )
+
+    def build():
+        return Flight(
+            rocket=request.getfixturevalue("calisto_air_brakes_clamp_on"),
+            environment=request.getfixturevalue("example_plain_env"),
+            rail_length=5.2,
+            inclination=85,
+            heading=0,
+            time_overshoot=False,
+            terminate_on_apogee=True,
+        )
+
+    return flight_calisto_factory("flight_calisto_air_brakes", build)
 
 
 @pytest.fixture
-def flight_calisto_with_sensors(calisto_with_sensors, example_plain_env):
+def flight_calisto_with_sensors(request, flight_calisto_factory):
     """A rocketpy.Flight object of the Calisto rocket. This uses the calisto
     with a set of ideal sensors. The environment is the simplest possible, with
     no parameters set.
 
     Parameters
     ----------
-    calisto_with_sensors : rocketpy.Rocket
-        An object of the Rocket class.
-    example_plain_env : rocketpy.Environment
-        An object of the Environment class.
+    request : pytest.FixtureRequest
+        Used to request the calisto_with_sensors and example_plain_env fixtures,
+        only when the Flight is simulated for the first time.
+    flight_calisto_factory : callable
+        Session-scoped factory of Flight objects. This is a pytest fixture
+        too.
 
     Returns
     -------
@@ -264,12 +343,16 @@ def flight_calisto_with_sensors(calisto_with_sensors, example_plain_env):
         A rocketpy.Flight object of the Calisto rocket in a more complex
         condition.
     """
-    return Flight(
-        rocket=calisto_with_sensors,
-        environment=example_plain_env,
-        rail_length=5.2,
-        inclination=85,
-        heading=0,
-        time_overshoot=False,
-        terminate_on_apogee=True,
-    )
+
+    def build():
+        return Flight(
+            rocket=request.getfixturevalue("calisto_with_sensors"),
+            environment=request.getfixturevalue("example_plain_env"),
+            rail_length=5.2,
+            inclination=85,
+            heading=0,
+            time_overshoot=False,
+            terminate_on_apogee=True,
+        )
+
+    return flight_calisto_factory("flight_calisto_with_sensors", build)
@@ -1,40 +1,65 @@
 import pytest
 
 from rocketpy import HybridMotor
+from tests.fixtures.motor.liquid_fixtures import (
+    build_oxidizer_fluid,
+    build_oxidizer_pressurant,
+)
+from tests.fixtures.motor.tanks_fixtures import build_spherical_oxidizer_tank
+from tests.fixtures.session_copy import session_copy_factory
+
+
+@pytest.fixture(scope="session")
+def hybrid_motor_factory():
+    """Session-scoped factory of the hybrid_motor fixture. The motor builds
+    its own oxidizer tank, the same as in the spherical_oxidizer_tank fixture,
+    so that it shares no object with any test.
+
+    Returns
+    -------
+    callable
+        A function with no arguments that returns a new copy of the
+        rocketpy.HybridMotor described in the hybrid_motor fixture.
+    """
+
+    def build():
+        motor = HybridMotor(
+            thrust_source=lambda t: 2000 - 100 * t,
+            burn_time=10,
+            center_of_dry_mass_position=0,
+            dry_inertia=(4, 4, 0.1),
+            dry_mass=8,
+            grain_density=1700,
+            grain_number=4,
+            grain_initial_height=0.1,
+            grain_separation=0,
+            grain_initial_inner_radius=0.04,
+            grain_outer_radius=0.1,
+            nozzle_position=-0.4,
+            nozzle_radius=0.07,
+            grains_center_of_mass_position=-0.1,
+        )
+        oxidizer_tank = build_spherical_oxidizer_tank(
+            build_oxidizer_fluid(), build_oxidizer_pressurant()
+        )
+        motor.add_tank(oxidizer_tank, position=0.3)
+        return motor
+
+    return session_copy_factory(build)
 
 
 @pytest.fixture
-def hybrid_motor(spherical_oxidizer_tank):
+def hybrid_motor(hybrid_motor_factory):
     """An example of a hybrid motor with spherical oxidizer
     tank and fuel grains.
 
     Parameters
     ----------
-    spherical_oxidizer_tank : rocketpy.LevelBasedTank
-        Example Tank that contains the motor oxidizer. This is a
-        pytest fixture.
+    hybrid_motor_factory : callable
+        Session-scoped factory of the motor. This is a pytest fixture.
 
     Returns
     -------
     rocketpy.HybridMotor
     """
-    motor = HybridMotor(
-        thrust_source=lambda t: 2000 - 100 * t,
-        burn_time=10,
-        center_of_dry_mass_position=0,
-        dry_inertia=(4, 4, 0.1),
-        dry_mass=8,
-        grain_density=1700,
-        grain_number=4,
-        grain_initial_height=0.1,
-        grain_separation=0,
-        grain_initial_inner_radius=0.04,
-        grain_outer_radius=0.1,
-        nozzle_position=-0.4,
-        nozzle_radius=0.07,
-        grains_center_of_mass_position=-0.1,
-    )
-
-    motor.add_tank(spherical_oxidizer_tank, position=0.3)
-
-    return motor
+    return hybrid_motor_factory()
@@ -29,6 +29,18 @@ def fuel_pressurant():
     return Fluid(name="N2", density=25)
 
 
+def build_oxidizer_pressurant():
+    """Builds the fluid of the oxidizer_pressurant fixture, N2 gas at
+    273.15K and 3MPa. Also used by session-scoped fixtures.
+
+    Returns
+    -------
+    rocketpy.Fluid
+        An object of the Fluid class.
+    """
+    return Fluid(name="N2", density=35)
+
+
 @pytest.fixture
 def oxidizer_pressurant():
     """An example of a pressurant fluid as N2 gas at
@@ -39,7 +51,7 @@ def oxidizer_pressurant():
     rocketpy.Fluid
         An object of the Fluid class.
     """
-    return Fluid(name="N2", density=35)
+    return build_oxidizer_pressurant()
 
 
 @pytest.fixture
@@ -55,6 +67,18 @@ def fuel_fluid():
     return Fluid(name="Propane", density=500)
 
 
+def build_oxidizer_fluid():
+    """Builds the fluid of the oxidizer_fluid fixture, liquid oxygen at
+    100K and 3MPa. Also used by session-scoped fixtures.
+
+    Returns
+    -------
+    rocketpy.Fluid
+        An object of the Fluid class.
+    """
+    return Fluid(name="O2", density=1000)
+
+
 @pytest.fixture
 def oxidizer_fluid():
     """An example of liquid oxygen as oxidizer fluid at
@@ -65,7 +89,7 @@ def oxidizer_fluid():
     rocketpy.Fluid
         An object of the Fluid class.
     """
-    return Fluid(name="O2", density=1000)
+    return build_oxidizer_fluid()
 
 
 @pytest.fixture
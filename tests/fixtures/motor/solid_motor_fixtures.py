@@ -1,42 +1,64 @@
 import pytest
 
 from rocketpy import SolidMotor
+from tests.fixtures.session_copy import session_copy_factory
 
 # Fixtures
 ## Motors and rockets
 
 
+@pytest.fixture(scope="session")
+def cesaroni_m1670_factory():
+    """Session-scoped factory of the Cesaroni M1670 motor.
+
+    Returns
+    -------
+    callable
+        A function with no arguments that returns a new copy of the
+        rocketpy.SolidMotor described in the cesaroni_m1670 fixture.
+    """
+
+    def build():
+        return SolidMotor(
+            thrust_source="data/motors/cesaroni/Cesaroni_M1670.eng",
+            burn_time=3.9,
+            dry_mass=1.815,
+            dry_inertia=(0.125, 0.125, 0.002),
+            center_of_dry_mass_position=0.317,
+            nozzle_position=0,
+            grain_number=5,
+            grain_density=1815,
+            nozzle_radius=33 / 1000,
+            throat_radius=11 / 1000,
+            grain_separation=5 / 1000,
+            grain_outer_radius=33 / 1000,
+            grain_initial_height=120 / 1000,
+            grains_center_of_mass_position=0.397,
+            grain_initial_inner_radius=15 / 1000,
+            interpolation_method="linear",
+            coordinate_system_orientation="nozzle_to_combustion_chamber",
+        )
+
+    return session_copy_factory(build)
+
+
 @pytest.fixture
-def cesaroni_m1670():  # old name: solid_motor
+def cesaroni_m1670(cesaroni_m1670_factory):  # old name: solid_motor
     """Create a simple object of the SolidMotor class to be used in the tests.
     This is the same motor that has been used in the getting started guide for
     years.
 
+    Parameters
+    ----------
+    cesaroni_m1670_factory : callable
+        Session-scoped factory of the motor. This is a pytest fixture too.
+
     Returns
     -------
     rocketpy.SolidMotor
         A simple object of the SolidMotor class
     """
-    example_motor = SolidMotor(
-        thrust_source="data/motors/cesaroni/Cesaroni_M1670.eng",
-        burn_time=3.9,
-        dry_mass=1.815,
-        dry_inertia=(0.125, 0.125, 0.002),
-        center_of_dry_mass_position=0.317,
-        nozzle_position=0,
-        grain_number=5,
-        grain_density=1815,
-        nozzle_radius=33 / 1000,
-        throat_radius=11 / 1000,
-        grain_separation=5 / 1000,
-        grain_outer_radius=33 / 1000,
-        grain_initial_height=120 / 1000,
-        grains_center_of_mass_position=0.397,
-        grain_initial_inner_radius=15 / 1000,
-        interpolation_method="linear",
-        coordinate_system_orientation="nozzle_to_combustion_chamber",
-    )
-    return example_motor
+    return cesaroni_m1670_factory()
 
 
 @pytest.fixture
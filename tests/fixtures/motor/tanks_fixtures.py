@@ -433,17 +433,16 @@ def oxidizer_tank(oxidizer_fluid, oxidizer_pressurant, propellant_tank_geometry)
     return oxidizer_tank
 
 
-@pytest.fixture
-def spherical_oxidizer_tank(oxidizer_fluid, oxidizer_pressurant):
-    """An example of a oxidizer spherical tank.
+def build_spherical_oxidizer_tank(oxidizer_fluid, oxidizer_pressurant):
+    """Builds the tank of the spherical_oxidizer_tank fixture. Also used by
+    session-scoped fixtures, such as the hybrid_motor_factory.
 
     Parameters
     ----------
     oxidizer_fluid : rocketpy.Fluid
-        Oxidizer fluid of the tank. This is a pytest fixture.
+        Oxidizer fluid of the tank.
     oxidizer_pressurant : rocketpy.Fluid
-        Pressurizing fluid of the oxidizer tank. This is a pytest
-        fixture.
+        Pressurizing fluid of the oxidizer tank.
 
     Returns
     -------
@@ -462,6 +461,25 @@ def spherical_oxidizer_tank(oxidizer_fluid, oxidizer_pressurant):
     return oxidizer_tank
 
 
+@pytest.fixture
+def spherical_oxidizer_tank(oxidizer_fluid, oxidizer_pressurant):
+    """An example of a oxidizer spherical tank.
+
+    Parameters
+    ----------
+    oxidizer_fluid : rocketpy.Fluid
+        Oxidizer fluid of the tank. This is a pytest fixture.
+    oxidizer_pressurant : rocketpy.Fluid
+        Pressurizing fluid of the oxidizer tank. This is a pytest
+        fixture.
+
+    Returns
+    -------
+    rocketpy.LevelBasedTank
+    """
+    return build_spherical_oxidizer_tank(oxidizer_fluid, oxidizer_pressurant)
+
+
 @pytest.fixture
 def cylindrical_variable_density_oxidizer_tank(nitrous_oxide_non_constant_fluid):
     """Fixture for creating a cylindrical variable density oxidizer
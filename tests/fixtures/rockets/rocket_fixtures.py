@@ -4,12 +4,39 @@ import pytest
 from rocketpy import Rocket
 
 
+@pytest.fixture(scope="session")
+def calisto_drag_curves():
+    """The power off and power on drag curves of the Calisto rocket. The csv
+    files are read only once per test session and shared by every Calisto
+    rocket fixture. The arrays are read-only to avoid cross-test contamination;
+    the Rocket class copies them into its own drag Functions.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The power off and power on drag curves, in this order, as arrays of
+        (Mach number, drag coefficient) points.
+    """
+    curves = (
+        np.loadtxt("data/rockets/calisto/powerOffDragCurve.csv", delimiter=","),
+        np.loadtxt("data/rockets/calisto/powerOnDragCurve.csv", delimiter=","),
+    )
+    for curve in curves:
+        curve.setflags(write=False)
+    return curves
+
+
 @pytest.fixture
-def calisto_motorless():
+def calisto_motorless(calisto_drag_curves):
     """Create a simple object of the Rocket class to be used in the tests. This
     is the same rocket that has been used in the getting started guide for years
     but without a motor.
 
+    Parameters
+    ----------
+    calisto_drag_curves : tuple of numpy.ndarray
+        The drag curves of the Calisto rocket. This is a pytest fixture too.
+
     Returns
     -------
     rocketpy.Rocket
@@ -19,8 +46,8 @@ def calisto_motorless():
         radius=0.0635,
         mass=14.426,
         inertia=(6.321, 6.321, 0.034),
-        power_off_drag="data/rockets/calisto/powerOffDragCurve.csv",
-        power_on_drag="data/rockets/calisto/powerOnDragCurve.csv",
+        power_off_drag=calisto_drag_curves[0],
+        power_on_drag=calisto_drag_curves[1],
         center_of_mass_without_motor=0,
         coordinate_system_orientation="tail_to_nose",
     )
@@ -52,7 +79,7 @@ def calisto(calisto_motorless, cesaroni_m1670):  # old name: rocket
 
 
 @pytest.fixture
-def calisto_nose_to_tail(cesaroni_m1670):
+def calisto_nose_to_tail(cesaroni_m1670, calisto_drag_curves):
     """Create a simple object of the Rocket class to be used in the tests. This
     is the same as the calisto fixture, but with the coordinate system
     orientation set to "nose_to_tail" instead of "tail_to_nose". This allows to
@@ -63,6 +90,8 @@ def calisto_nose_to_tail(cesaroni_m1670):
     ----------
     cesaroni_m1670 : rocketpy.SolidMotor
         An object of the SolidMotor class. This is a pytest fixture too.
+    calisto_drag_curves : tuple of numpy.ndarray
+        The drag curves of the Calisto rocket. This is a pytest fixture too.
 
     Returns
     -------
@@ -74,8 +103,8 @@ def calisto_nose_to_tail(cesaroni_m1670):
         radius=0.0635,
         mass=14.426,
         inertia=(6.321, 6.321, 0.034),
-        power_off_drag="data/rockets/calisto/powerOffDragCurve.csv",
-        power_on_drag="data/rockets/calisto/powerOnDragCurve.csv",
+        power_off_drag=calisto_drag_curves[0],
+        power_on_drag=calisto_drag_curves[1],
         center_of_mass_without_motor=0,
         coordinate_system_orientation="nose_to_tail",
     )
@@ -305,7 +334,7 @@ def calisto_with_sensors(
 
 
 @pytest.fixture  # old name: dimensionless_rocket
-def dimensionless_calisto(kg, m, dimensionless_cesaroni_m1670):
+def dimensionless_calisto(kg, m, dimensionless_cesaroni_m1670, calisto_drag_curves):
     """The dimensionless version of the Calisto rocket. This is the same rocket
     as defined in the calisto fixture, but with all the parameters converted to
     dimensionless values. This allows to check if the dimensions are being
@@ -320,6 +349,8 @@ def dimensionless_calisto(kg, m, dimensionless_cesaroni_m1670):
     dimensionless_cesaroni_m1670 : rocketpy.SolidMotor
         The dimensionless version of the Cesaroni M1670 motor. This is a pytest
         fixture too.
+    calisto_drag_curves : tuple of numpy.ndarray
+        The drag curves of the Calisto rocket. This is a pytest fixture too.
 
     Returns
     -------
@@ -330,8 +361,8 @@ def dimensionless_calisto(kg, m, dimensionless_cesaroni_m1670):
         radius=0.0635 * m,
         mass=14.426 * kg,
         inertia=(6.321 * (kg * m**2), 6.321 * (kg * m**2), 0.034 * (kg * m**2)),
-        power_off_drag="data/rockets/calisto/powerOffDragCurve.csv",
-        power_on_drag="data/rockets/calisto/powerOnDragCurve.csv",
+        power_off_drag=calisto_drag_curves[0],
+        power_on_drag=calisto_drag_curves[1],
         center_of_mass_without_motor=0 * m,
         coordinate_system_orientation="tail_to_nose",
     )
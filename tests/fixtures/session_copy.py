@@ -0,0 +1,133 @@
+"""Helpers shared by the session-scoped fixture factories. Building motors,
+environments and flights is expensive, so these are built once per test
+session and every test receives their own copy."""
+
+import copy
+import types
+
+
+def _cell_contents(cell):
+    """Returns a list with the contents of a closure cell, empty if the cell
+    is empty."""
+    try:
+        return [cell.cell_contents]
+    except ValueError:
+        return []
+
+
+def _find_closures(obj):
+    """Lists every function with a closure that can be reached from ``obj``
+    through containers, instance attributes, bound methods and closures.
+
+    Parameters
+    ----------
+    obj : object
+        Object to be searched.
+
+    Returns
+    -------
+    list[types.FunctionType]
+        The functions found, with no repetitions.
+    """
+    closures = []
+    visited = set()
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in visited or isinstance(current, (type, types.ModuleType)):
+            continue
+        visited.add(id(current))
+
+        if isinstance(current, types.FunctionType):
+            if current.__closure__:
+                closures.append(current)
+                for cell in current.__closure__:
+                    stack.extend(_cell_contents(cell))
+        elif isinstance(current, types.MethodType):
+            stack.extend((current.__func__, current.__self__))
+        elif isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif hasattr(current, "__dict__"):
+            stack.extend(vars(current).values())
+    return closures
+
+
+def _decoupled_deepcopy(obj, closures):
+    """Deep copies ``obj`` together with the objects captured by the given
+    closures. ``copy.deepcopy`` alone keeps functions as they are, so a lambda
+    of the copy, e.g. the source of ``Rocket.stability_margin``, would still
+    read from the original object.
+
+    Parameters
+    ----------
+    obj : object
+        Object to be copied.
+    closures : list[types.FunctionType]
+        Functions with a closure that can be reached from ``obj``, as listed
+        by ``_find_closures``.
+
+    Returns
+    -------
+    object
+        The copy of ``obj``.
+    """
+    # Seed the memo with an empty-celled copy of each closure, so that every
+    # reference to them inside obj resolves to the copy while it is built
+    memo = {}
+    copied_cells = []
+    for function in closures:
+        cells = tuple(types.CellType() for _ in function.__closure__)
+        function_copy = types.FunctionType(
+            function.__code__,
+            function.__globals__,
+            function.__name__,
+            function.__defaults__,
+            cells,
+        )
+        function_copy.__kwdefaults__ = function.__kwdefaults__
+        function_copy.__qualname__ = function.__qualname__
+        function_copy.__dict__.update(function.__dict__)
+        memo[id(function)] = function_copy
+        copied_cells.append((function.__closure__, cells))
+
+    obj_copy = copy.deepcopy(obj, memo)
+
+    # Fill the cells only now, when the memo maps captured objects to copies
+    for cells, cells_copy in copied_cells:
+        for cell, cell_copy in zip(cells, cells_copy):
+            for contents in _cell_contents(cell):
+                cell_copy.cell_contents = copy.deepcopy(contents, memo)
+    return obj_copy
+
+
+def session_copy_factory(builder):
+    """Creates a factory of independent copies of an object that is built only
+    once. The copies share no state with each other, with the stored object
+    or with the objects given to ``builder``, not even through the lambdas
+    of their Functions.
+
+    Parameters
+    ----------
+    builder : callable
+        Function with no arguments that builds the object. It is only called
+        the first time the factory is called.
+
+    Returns
+    -------
+    callable
+        A function with no arguments that returns a new copy of the object.
+    """
+    stored = []
+
+    def factory():
+        if not stored:
+            built = builder()
+            original = _decoupled_deepcopy(built, _find_closures(built))
+            stored.append((original, _find_closures(original)))
+        original, closures = stored[0]
+        return _decoupled_deepcopy(original, closures)
+
+    return factory
@@ -1,24 +1,28 @@
 # pylint: disable=unused-argument
-import os
+from pathlib import Path
 from unittest.mock import patch
 
 import matplotlib as plt
 import numpy as np
 import pytest
 
+from rocketpy.simulation.monte_carlo import MonteCarlo, _SimMonitor
+
 plt.rcParams.update({"figure.max_open_warning": 0})
 
 
+MONTE_CARLO_TEST_FILES = [
+    Path("monte_carlo_class_example.kml"),
+    Path("monte_carlo_test.errors.txt"),
+    Path("monte_carlo_test.inputs.txt"),
+    Path("monte_carlo_test.outputs.txt"),
+]
+
+
 def _post_test_file_cleanup():
     """Clean monte carlo files after test session if they exist."""
-    if os.path.exists("monte_carlo_class_example.kml"):
-        os.remove("monte_carlo_class_example.kml")
-    if os.path.exists("monte_carlo_test.errors.txt"):
-        os.remove("monte_carlo_test.errors.txt")
-    if os.path.exists("monte_carlo_test.inputs.txt"):
-        os.remove("monte_carlo_test.inputs.txt")
-    if os.path.exists("monte_carlo_test.outputs.txt"):
-        os.remove("monte_carlo_test.outputs.txt")
+    for filepath in MONTE_CARLO_TEST_FILES:
+        filepath.unlink(missing_ok=True)
 
 
 @pytest.mark.slow
@@ -56,6 +60,78 @@ def test_monte_carlo_simulate(monte_carlo_calisto, parallel):
         _post_test_file_cleanup()
 
 
+@pytest.mark.slow
+@patch("os.cpu_count", return_value=4)
+def test_monte_carlo_simulate_more_workers_than_simulations(
+    mock_cpu_count, monte_carlo_calisto
+):
+    """Tests that a parallel run with a single simulation left falls back to
+    serial mode instead of starting worker processes.
+
+    Parameters
+    ----------
+    mock_cpu_count : unittest.mock.MagicMock
+        Mock of os.cpu_count, so that 4 workers are valid on any machine.
+    monte_carlo_calisto : MonteCarlo
+        The MonteCarlo object, this is a pytest fixture.
+    """
+    run_in_serial = MonteCarlo._MonteCarlo__run_in_serial
+    try:
+        with (
+            patch.object(
+                MonteCarlo,
+                "_MonteCarlo__run_in_serial",
+                autospec=True,
+                side_effect=run_in_serial,
+            ) as mock_run_in_serial,
+            patch(
+                "rocketpy.simulation.monte_carlo._import_multiprocess"
+            ) as mock_import_multiprocess,
+        ):
+            monte_carlo_calisto.simulate(
+                number_of_simulations=1, append=False, parallel=True, n_workers=4
+            )
+
+        mock_run_in_serial.assert_called_once_with(monte_carlo_calisto)
+        mock_import_multiprocess.assert_not_called()
+        assert monte_carlo_calisto.num_of_loaded_sims == 1
+    finally:
+        _post_test_file_cleanup()
+
+
+@patch("os.cpu_count", return_value=4)
+def test_monte_carlo_parallel_workers_capped_at_remaining_simulations(
+    mock_cpu_count, monte_carlo_calisto
+):
+    """Tests that a parallel run does not start more workers than there are
+    simulations left. The run is stopped right before the worker processes
+    would be spawned.
+
+    Parameters
+    ----------
+    mock_cpu_count : unittest.mock.MagicMock
+        Mock of os.cpu_count, so that 4 workers are valid on any machine.
+    monte_carlo_calisto : MonteCarlo
+        The MonteCarlo object, this is a pytest fixture.
+    """
+    try:
+        with (
+            patch.object(_SimMonitor, "reprint") as mock_reprint,
+            patch(
+                "rocketpy.simulation.monte_carlo._import_multiprocess",
+                side_effect=RuntimeError("stop before spawning workers"),
+            ),
+            pytest.raises(RuntimeError, match="stop before spawning workers"),
+        ):
+            monte_carlo_calisto.simulate(
+                number_of_simulations=3, append=False, parallel=True, n_workers=4
+            )
+
+        mock_reprint.assert_any_call("Running Monte Carlo simulation with 3 workers.")
+    finally:
+        _post_test_file_cleanup()
+
+
 def test_monte_carlo_set_inputs_log(monte_carlo_calisto):
     """Tests the set_inputs_log method of the MonteCarlo class.
 
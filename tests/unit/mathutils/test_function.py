@@ -2,6 +2,8 @@
 individual method of the Function class. The tests are made on both the
 expected behaviour and the return instances."""
 
+import warnings
+
 import matplotlib as plt
 import numpy as np
 import pytest
@@ -396,6 +398,73 @@ def test_set_get_value_opt():
     assert func.get_value_opt(2.5) == 6.5
 
 
+def test_get_value_opt_repeated_point_after_set_interpolation():
+    """Test that repeated evaluations of get_value_opt at the same point are
+    not affected by a change of interpolation method in between."""
+    func = Function(np.array([[1, 1], [2, 4], [3, 9], [4, 16], [5, 25]]))
+    func.set_interpolation("linear")
+    assert func.get_value_opt(2.5) == 6.5
+    assert func.get_value_opt(2.5) == 6.5
+    func.set_interpolation("spline")
+    assert func.get_value_opt(2.5) == pytest.approx(func(2.5))
+    assert func.get_value_opt(2.5) != 6.5
+
+
+def test_get_value_opt_alternating_points():
+    """Test that get_value_opt never returns the value of the previous point
+    when evaluated at alternating points and then twice at the same point."""
+    func = Function(np.array([[1, 1], [2, 4], [3, 9], [4, 16], [5, 25]]))
+    func.set_interpolation("linear")
+    for x, expected in [(2.5, 6.5), (3.5, 12.5), (2.5, 6.5), (3.5, 12.5)]:
+        assert func.get_value_opt(x) == expected
+    assert func.get_value_opt(4.5) == 20.5
+    assert func.get_value_opt(4.5) == 20.5
+    assert func.get_value_opt(1.5) == 2.5
+
+
+@pytest.mark.parametrize(
+    "x, expected",
+    [
+        (1, 1),
+        (1 + 1e-9, 1 + 3e-9),
+        (1.25, 1.75),
+        (4.75, 22.75),
+        (5 - 1e-9, 25 - 9e-9),
+        (5, 25),
+    ],
+)
+@pytest.mark.parametrize("method", ["get_value", "get_value_opt"])
+def test_linear_interpolation_at_domain_edges(x, expected, method):
+    """Test the 1-D linear interpolation exactly at the first and last samples
+    and just inside them. At the first sample the interpolation uses the slope
+    stored at the last position of the coefficients."""
+    func = Function(
+        np.array([[1, 1], [2, 4], [3, 9], [4, 16], [5, 25]]), interpolation="linear"
+    )
+    assert getattr(func, method)(x) == pytest.approx(expected, rel=1e-15)
+
+
+@pytest.mark.parametrize(
+    "x, expected", [(0, 0), (0.5, 0.5), (1, 1), (1.5, 2.5), (2, 3)]
+)
+@pytest.mark.parametrize("method", ["get_value", "get_value_opt"])
+def test_linear_interpolation_duplicated_x(x, expected, method):
+    """Test the 1-D linear interpolation of a source with a repeated x value.
+    The zero width interval must not turn the results into NaN, nor warn about
+    a division by zero."""
+    func = Function([[0, 0], [1, 1], [1, 2], [2, 3]], interpolation="linear")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert getattr(func, method)(x) == expected
+
+
+def test_linear_interpolation_single_point():
+    """Test that a single point linear Function is constant at its point."""
+    func = Function([[1, 5]], interpolation="linear")
+    assert func.get_value_opt(1) == 5
+    assert func.get_value(1) == 5
+
+
 def test_get_image_dim(linear_func):
     """Test the get_img_dim method of the Function class."""
     assert linear_func.get_image_dim() == 1
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from rocketpy.motors.cluster_motor import ClusterMotor
+
+POSITIONS = [(0.1, 0.0, -1.2), (-0.05, 0.08, -1.25), (-0.05, -0.08, -1.3)]
+ORIENTATIONS = [(0.1, 0.0, 1.0), (-0.05, 0.2, 1.0), (0.0, -0.1, 1.0)]
+
+
+@pytest.mark.parametrize("t", [0.5, 2.0, 3.5])
+@pytest.mark.parametrize("ref_point", [(0, 0, 0), (0.01, -0.02, -0.4)])
+def test_cluster_motor_total_moment(cesaroni_m1670, t, ref_point):
+    """Tests the ClusterMotor total moment against the moments of each motor
+    computed with np.cross, for three motors that are off-axis and tilted.
+
+    Parameters
+    ----------
+    cesaroni_m1670 : rocketpy.SolidMotor
+        The SolidMotor object to be used in the tests.
+    t : float
+        Time at which the moment is evaluated.
+    ref_point : tuple
+        Point about which the moment is evaluated.
+    """
+    motors = [cesaroni_m1670] * 3
+    cluster = ClusterMotor(motors, POSITIONS, ORIENTATIONS)
+
+    expected_moment = np.zeros(3)
+    for motor, position, orientation in zip(motors, POSITIONS, ORIENTATIONS):
+        direction = np.array(orientation) / np.linalg.norm(orientation)
+        force = motor.thrust(t) * direction
+        expected_moment += np.cross(np.array(position) - ref_point, force)
+
+    moment = cluster.get_total_moment(t, ref_point)
+
+    assert np.allclose(list(moment), expected_moment, rtol=1e-12, atol=1e-12)
+    assert np.linalg.norm(expected_moment) > 1
@@ -52,19 +52,16 @@ def test_generic_motor_thrust_parameters(generic_motor):
     generic_motor : rocketpy.GenericMotor
         The GenericMotor object to be used in the tests.
     """
-    expected_thrust = np.array(
-        [(t, thrust_source(t)) for t in np.linspace(*BURN_TIME, 50)]
-    )
-    expected_total_impulse = scipy.integrate.trapezoid(
-        expected_thrust[:, 1], expected_thrust[:, 0]
-    )
+    time = np.linspace(*BURN_TIME, 50)
+    expected_thrust = thrust_source(time)
+    expected_total_impulse = scipy.integrate.trapezoid(expected_thrust, time)
     expected_exhaust_velocity = expected_total_impulse / PROPELLANT_INITIAL_MASS
-    expected_mass_flow_rate = -1 * expected_thrust[:, 1] / expected_exhaust_velocity
+    expected_mass_flow_rate = -expected_thrust / expected_exhaust_velocity
 
     # Discretize mass flow rate for testing purposes
     mass_flow_rate = generic_motor.total_mass_flow_rate.set_discrete(*BURN_TIME, 50)
 
-    assert generic_motor.thrust.y_array == pytest.approx(expected_thrust[:, 1])
+    assert generic_motor.thrust.y_array == pytest.approx(expected_thrust)
     assert generic_motor.total_impulse == pytest.approx(expected_total_impulse)
     assert generic_motor.exhaust_velocity.average(*BURN_TIME) == pytest.approx(
         expected_exhaust_velocity
@@ -106,7 +103,8 @@ def test_generic_motor_inertia(generic_motor):
         The GenericMotor object to be used in the tests.
     """
     # Tests the inertia formulation from the propellant mass
-    propellant_mass = generic_motor.propellant_mass.set_discrete(*BURN_TIME, 50).y_array
+    time = np.linspace(*BURN_TIME, 50)
+    propellant_mass = generic_motor.propellant_mass(time)
 
     propellant_I_11 = propellant_mass * (CHAMBER_RADIUS**2 / 4 + CHAMBER_HEIGHT**2 / 12)
     propellant_I_22 = propellant_I_11
@@ -117,20 +115,13 @@ def test_generic_motor_inertia(generic_motor):
     I_22 = propellant_I_22 + DRY_INERTIA[1]
     I_33 = propellant_I_33 + DRY_INERTIA[2]
 
-    # Discretize inertia for testing purposes
-    generic_motor.propellant_I_11.set_discrete(*BURN_TIME, 50)
-    generic_motor.propellant_I_22.set_discrete(*BURN_TIME, 50)
-    generic_motor.propellant_I_33.set_discrete(*BURN_TIME, 50)
-    generic_motor.I_11.set_discrete(*BURN_TIME, 50)
-    generic_motor.I_22.set_discrete(*BURN_TIME, 50)
-    generic_motor.I_33.set_discrete(*BURN_TIME, 50)
-
-    assert generic_motor.propellant_I_11.y_array == pytest.approx(propellant_I_11)
-    assert generic_motor.propellant_I_22.y_array == pytest.approx(propellant_I_22)
-    assert generic_motor.propellant_I_33.y_array == pytest.approx(propellant_I_33)
-    assert generic_motor.I_11.y_array == pytest.approx(I_11)
-    assert generic_motor.I_22.y_array == pytest.approx(I_22)
-    assert generic_motor.I_33.y_array == pytest.approx(I_33)
+    # Evaluate inertia on the same time grid, no need to discretize each one
+    assert generic_motor.propellant_I_11(time) == pytest.approx(propellant_I_11)
+    assert generic_motor.propellant_I_22(time) == pytest.approx(propellant_I_22)
+    assert generic_motor.propellant_I_33(time) == pytest.approx(propellant_I_33)
+    assert generic_motor.I_11(time) == pytest.approx(I_11)
+    assert generic_motor.I_22(time) == pytest.approx(I_22)
+    assert generic_motor.I_33(time) == pytest.approx(I_33)
 
 
 def test_load_from_eng_file(generic_motor):
@@ -1,4 +1,5 @@
 import os
+from math import isclose
 from unittest.mock import patch
 
 import numpy as np
@@ -172,18 +173,13 @@ def test_initialize_motor_asserts_dynamic_values(cesaroni_m1670):
         np.pi * (GRAIN_OUTER_RADIUS**2 - GRAIN_INITIAL_INNER_RADIUS**2)
     )
     grain_mass = grain_vol * GRAIN_DENSITY
+    thrust_integral = cesaroni_m1670.thrust.integral(0, BURN_TIME)
 
     assert abs(cesaroni_m1670.max_thrust - 2200.0) < 1e-9
     assert abs(cesaroni_m1670.max_thrust_time - 0.15) < 1e-9
     assert abs(cesaroni_m1670.burn_time[1] - BURN_TIME) < 1e-9
-    assert (
-        abs(cesaroni_m1670.total_impulse - cesaroni_m1670.thrust.integral(0, BURN_TIME))
-        < 1e-9
-    )
-    assert (
-        cesaroni_m1670.average_thrust
-        - cesaroni_m1670.thrust.integral(0, BURN_TIME) / BURN_TIME
-    ) < 1e-9
+    assert abs(cesaroni_m1670.total_impulse - thrust_integral) < 1e-9
+    assert (cesaroni_m1670.average_thrust - thrust_integral / BURN_TIME) < 1e-9
     assert abs(cesaroni_m1670.grain_initial_volume - grain_vol) < 1e-9
     assert abs(cesaroni_m1670.grain_initial_mass - grain_mass) < 1e-9
     assert (
@@ -192,25 +188,19 @@ def test_initialize_motor_asserts_dynamic_values(cesaroni_m1670):
     assert (
         abs(
             cesaroni_m1670.exhaust_velocity(0)
-            - cesaroni_m1670.thrust.integral(0, BURN_TIME) / (GRAIN_NUMBER * grain_mass)
+            - thrust_integral / (GRAIN_NUMBER * grain_mass)
         )
         < 1e-9
     )
 
 
 def test_grain_geometry_progression_asserts_extreme_values(cesaroni_m1670):
-    assert np.allclose(
-        cesaroni_m1670.grain_inner_radius.get_source()[-1][-1],
-        cesaroni_m1670.grain_outer_radius,
-    )
-    assert (
-        cesaroni_m1670.grain_inner_radius.get_source()[0][-1]
-        < cesaroni_m1670.grain_inner_radius.get_source()[-1][-1]
-    )
-    assert (
-        cesaroni_m1670.grain_height.get_source()[0][-1]
-        > cesaroni_m1670.grain_height.get_source()[-1][-1]
-    )
+    inner_radius = cesaroni_m1670.grain_inner_radius.get_source()
+    height = cesaroni_m1670.grain_height.get_source()
+
+    assert np.allclose(inner_radius[-1][-1], cesaroni_m1670.grain_outer_radius)
+    assert inner_radius[0][-1] < inner_radius[-1][-1]
+    assert height[0][-1] > height[-1][-1]
 
 
 def test_mass_curve_asserts_extreme_values(cesaroni_m1670):
@@ -246,10 +236,10 @@ def test_burn_area_asserts_extreme_values(cesaroni_m1670):
         * GRAIN_NUMBER
     )
 
-    assert np.allclose(cesaroni_m1670.burn_area.get_source()[0][-1], initial_burn_area)
-    assert np.allclose(
-        cesaroni_m1670.burn_area.get_source()[-1][-1], final_burn_area, atol=1e-6
-    )
+    burn_area = cesaroni_m1670.burn_area.get_source()
+
+    assert isclose(burn_area[0][-1], initial_burn_area)
+    assert isclose(burn_area[-1][-1], final_burn_area, abs_tol=1e-6)
 
 
 @pytest.mark.parametrize("tuple_parametric", [(5, 3000)])
@@ -223,23 +223,25 @@ def test_check_constant(f, eps, expected):
     assert result == expected
 
 
-def test_save_to_rpy(flight_calisto_robust):
+def test_save_to_rpy(flight_calisto_robust, tmp_path):
     """Tests if the save_to_rpy function correctly saves the data to the
     correct file.
 
     Parameters
     ----------
-    flight_calisto_custom_wind : Flight
+    flight_calisto_robust : Flight
         A Flight object with a rocket with fins. This flight object was created
         in the conftest.py file.
+    tmp_path : pathlib.Path
+        Pytest temporary directory, so no file is left behind on failure.
     """
-    utilities.save_to_rpy(flight_calisto_robust, "flight_calisto_robust.rpy")
-    assert os.path.splitext(os.path.basename("flight_calisto_robust.rpy")) == (
+    file_path = tmp_path / "flight_calisto_robust.rpy"
+    utilities.save_to_rpy(flight_calisto_robust, file_path)
+    assert os.path.splitext(os.path.basename(file_path)) == (
         "flight_calisto_robust",
         ".rpy",
     )
-    assert os.path.getsize("flight_calisto_robust.rpy") > 0
-    os.remove("flight_calisto_robust.rpy")
+    assert os.path.getsize(file_path) > 0
 
 
 @patch("matplotlib.pyplot.show")